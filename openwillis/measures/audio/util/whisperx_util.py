@@ -4,6 +4,15 @@
 import whisperx
 import gc 
 import torch
+import functools
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    from faster_whisper import WhisperModel, BatchedInferencePipeline
+
+except ImportError:
+    # faster-whisper < 1.1 (pinned by whisperx 3.1.x) has no batched pipeline; use whisperx.load_model instead
+    WhisperModel = BatchedInferencePipeline = None
 
 import json
 import logging
@@ -11,22 +20,106 @@ import logging
 logging.basicConfig(level=logging.INFO)
 logger=logging.getLogger()
 
-def delete_model(model):
+def delete_model(model, force_gc=False):
     """
     ------------------------------------------------------------------------------------------------------
 
-    delete model if low on GPU resources
+    delete model if low on GPU resources; GPU memory is released before the caller drops its reference
     Parameters:
     ...........
     model : object
-        loaded model object
+        loaded model object (torch module or CTranslate2 model)
+    force_gc : bool
+        run the garbage collector before emptying the CUDA cache
     
     ------------------------------------------------------------------------------------------------------
     """
-    gc.collect()
-    torch.cuda.empty_cache()
+    if isinstance(model, torch.nn.Module):
+        model.to('cpu')
+    elif hasattr(model, 'unload_model'):
+        model.unload_model()
     del model
 
+    if force_gc:
+        gc.collect()
+    torch.cuda.empty_cache()
+
+@functools.lru_cache(maxsize=4)
+def _cached_align_model(language, device):
+    """
+    ------------------------------------------------------------------------------------------------------
+
+    Load and cache the whisperx alignment model
+    Parameters:
+    ...........
+    language : str
+        language code
+    device : str
+        device type
+
+    Returns:
+    ...........
+    model_a : object
+        alignment model
+    metadata : dict
+        alignment model metadata
+
+    ------------------------------------------------------------------------------------------------------
+    """
+    model_a, metadata = whisperx.load_align_model(language_code=language, device=device)
+    return model_a, metadata
+
+@functools.lru_cache(maxsize=4)
+def _cached_diarize_pipeline(hf_token, device):
+    """
+    ------------------------------------------------------------------------------------------------------
+
+    Load and cache the whisperx diarization pipeline
+    Parameters:
+    ...........
+    hf_token : str
+        huggingface access token
+    device : str
+        device type
+
+    Returns:
+    ...........
+    diarize_model : object
+        diarization pipeline
+
+    ------------------------------------------------------------------------------------------------------
+    """
+    diarize_model = whisperx.DiarizationPipeline(use_auth_token=hf_token, device=device)
+    return diarize_model
+
+def load_align_model(language, device, use_cache):
+    """
+    ------------------------------------------------------------------------------------------------------
+
+    Load the whisperx alignment model, reusing the cached model when enabled
+    Parameters:
+    ...........
+    language : str
+        language code
+    device : str
+        device type
+    use_cache : bool
+        whether to reuse the model across calls
+
+    Returns:
+    ...........
+    model_a : object
+        alignment model
+    metadata : dict
+        alignment model metadata
+
+    ------------------------------------------------------------------------------------------------------
+    """
+    if use_cache:
+        return _cached_align_model(language, device)
+
+    return whisperx.load_align_model(language_code=language, device=device)
+
 def get_diarization(audio, align_json, device, input_param):
     """
     ------------------------------------------------------------------------------------------------------
@@ -51,7 +144,9 @@ def get_diarization(audio, align_json, device, input_param):
     ------------------------------------------------------------------------------------------------------
     """
     # Assign speaker labels
-    if input_param['infra_model'][0]:
+    if input_param['infra_model'][0] and input_param['use_cache']:
+        diarize_model = _cached_diarize_pipeline(input_param['hf_token'], device)
+    elif input_param['infra_model'][0]:
         diarize_model = whisperx.DiarizationPipeline(use_auth_token=input_param['hf_token'], device=device)
     else:
         diarize_model = input_param['infra_model'][2]
@@ -88,13 +183,64 @@ def get_transcribe_summary(json_response):
 
     ------------------------------------------------------------------------------------------------------
     """
-    summary = ""
-    
-    if 'segments' in json_response:
-        summary = "".join([item['text'] for item in json_response["segments"] if item.get('text', '')])
+    segments = json_response.get('segments', ())
+    summary = "".join(text for text in (item.get('text', '') for item in segments) if text)
     return summary
 
-def transcribe_whisper(filepath, model, device, compute_type, batch_size, infra_model, language):
+def load_whisper_model(model, device, compute_type):
+    """
+    ------------------------------------------------------------------------------------------------------
+
+    Load faster-whisper (CTranslate2) model wrapped in a batched inference pipeline, or the whisperx
+    pipeline when the installed faster-whisper has no batched pipeline
+    Parameters:
+    ...........
+    model: str
+        name of the pretrained model
+    device: str
+        cpu vs gpu
+    compute_type: str
+        computation format
+
+    Returns:
+    ...........
+    batched_model : object
+        batched faster-whisper inference pipeline (or whisperx pipeline)
+
+    ------------------------------------------------------------------------------------------------------
+    """
+    if BatchedInferencePipeline is None:
+        return whisperx.load_model(model, device, compute_type=compute_type)
+
+    model_whisp = WhisperModel(model, device=device, compute_type=compute_type)
+    batched_model = BatchedInferencePipeline(model=model_whisp)
+    return batched_model
+
+def get_segments_json(segments, info):
+    """
+    ------------------------------------------------------------------------------------------------------
+
+    Materialize faster-whisper segments into the whisperx transcription format
+    Parameters:
+    ...........
+    segments: generator
+        faster-whisper segment iterator
+    info: object
+        faster-whisper transcription info
+
+    Returns:
+    ...........
+    transcribe_json : dict
+        whisper transcribed output with segments and language
+
+    ------------------------------------------------------------------------------------------------------
+    """
+    segment_list = [{'text': segment.text, 'start': segment.start, 'end': segment.end} for segment in segments]
+    
+    transcribe_json = {'segments': segment_list, 'language': info.language}
+    return transcribe_json
+
+def transcribe_whisper(filepath, model, device, compute_type, batch_size, infra_model, language, del_model=False):
     """
     ------------------------------------------------------------------------------------------------------
    
@@ -116,20 +262,63 @@ def transcribe_whisper(filepath, model, device, compute_type, batch_size, infra_
         whisper model artifacts (this is optional param: to optimize willisInfra) 
     language: str
         language code
+    del_model: bool
+        release the whisper model once transcription is done
 
         
     ------------------------------------------------------------------------------------------------------
     """
+    audio = whisperx.load_audio(filepath)
+
     if infra_model[0]:
-        model_whisp = whisperx.load_model(model, device, compute_type=compute_type)
+        batched_model = load_whisper_model(model, device, compute_type)
+
+        if BatchedInferencePipeline is None:
+            transcribe_json = batched_model.transcribe(audio, batch_size=batch_size, language=language)
+        else:
+            segments, info = batched_model.transcribe(audio, batch_size=batch_size, language=language, vad_filter=True)
+            transcribe_json = get_segments_json(segments, info)
+
+        if del_model:
+            delete_model(batched_model.model.model) #CTranslate2 whisper model
     
     else:
         model_whisp = infra_model[1] #passing param from willismeansure
-    audio = whisperx.load_audio(filepath)
-
-    transcribe_json = model_whisp.transcribe(audio, batch_size=batch_size, language=language)
+        transcribe_json = model_whisp.transcribe(audio, batch_size=batch_size, language=language)
     return transcribe_json, audio
 
+def get_compute_type(device, input_param):
+    """
+    ------------------------------------------------------------------------------------------------------
+
+    Select computation format for the whisper model
+    Parameters:
+    ...........
+    device : str
+        device type
+    input_param : dict
+        A dictionary containing input parameters
+
+    Returns:
+    ...........
+    compute_type : str
+        computation format
+
+    ------------------------------------------------------------------------------------------------------
+    """
+    if input_param['compute_type_override'] is not None:
+        return input_param['compute_type_override']
+
+    if device != 'cuda':
+        return input_param['compute_type']
+
+    # INT8 tensor cores are available from compute capability 7.5 (Turing) onwards
+    if torch.cuda.get_device_capability() >= (7, 5):
+        return 'int8_float16'
+
+    logger.warning('GPU compute capability is below 7.5, int8_float16 is not supported; using float16')
+    return 'float16'
+
 def get_whisperx_diariazation(filepath, input_param):
     """
     ------------------------------------------------------------------------------------------------------
@@ -153,7 +342,6 @@ def get_whisperx_diariazation(filepath, input_param):
     ------------------------------------------------------------------------------------------------------
     """
     device = 'cpu'
-    compute_type = input_param['compute_type']
     
     json_response = json.dumps({})
     transcript = ''
@@ -161,15 +349,19 @@ def get_whisperx_diariazation(filepath, input_param):
     try:
         if torch.cuda.is_available():
             device = 'cuda'
-            compute_type = "float16"
+        compute_type = get_compute_type(device, input_param)
     
-        transcribe_json, audio = transcribe_whisper(filepath, input_param['model'], device, compute_type, input_param['batch_size'], input_param['infra_model'], input_param['language'])
+        # Load the alignment model on cpu while transcription runs, keeping GPU memory free for diarization
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            align_future = executor.submit(load_align_model, input_param['language'], 'cpu', input_param['use_cache'])
+            
+            transcribe_json, audio = transcribe_whisper(filepath, input_param['model'], device, compute_type, input_param['batch_size'], input_param['infra_model'], input_param['language'], input_param['del_model'])
+            model_a, metadata = align_future.result()
     
         # Align whisper output
-        model_a, metadata = whisperx.load_align_model(language_code=input_param['language'], device=device)
-        align_json = whisperx.align(transcribe_json["segments"], model_a, metadata, audio, device, return_char_alignments=False)
+        align_json = whisperx.align(transcribe_json["segments"], model_a, metadata, audio, 'cpu', return_char_alignments=False)
     
-        if input_param['del_model']:
+        if input_param['del_model'] and not input_param['use_cache']:
             delete_model(model_a)
             
         json_response = get_diarization(audio, align_json, device, input_param)    
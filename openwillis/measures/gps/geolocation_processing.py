@@ -1,9 +1,11 @@
 # author:    Georgios Efstathiadis
 # website:   http://www.bklynhlth.com
 
+import functools
 import json
 import logging
 import os
+from pathlib import Path
 
 import numpy as np
 import pandas as pd
@@ -84,12 +86,36 @@ def create_empty_dataframes(config):
     return [hourly, daily, summary]
 
 
+def _empty_stub(columns):
+    """
+    ------------------------------------------------------------------------------------------------------
+
+    This function creates a single-row dataframe filled with missing values, used as the output
+    when no statistics could be calculated.
+
+    Parameters:
+    ...........
+    columns : list
+        The column names of the dataframe.
+
+    Returns:
+    ...........
+    df: A dataframe with one row of pd.NA values.
+
+    ------------------------------------------------------------------------------------------------------
+    """
+
+    return pd.DataFrame({col: [pd.NA] for col in columns})
+
+
+@functools.lru_cache(maxsize=8)
 def get_config(filepath, json_file):
     """
     ------------------------------------------------------------------------------------------------------
 
     This function reads the configuration file containing the column names for the output dataframes,
-    and returns the contents of the file as a dictionary.
+    and returns the contents of the file as a dictionary. The parsed configuration is cached, so the
+    returned dictionary must not be modified.
 
     Parameters:
     ...........
@@ -107,8 +133,7 @@ def get_config(filepath, json_file):
     dir_name = os.path.dirname(filepath)
     measure_path = os.path.abspath(os.path.join(dir_name, f"config/{json_file}"))
 
-    file = open(measure_path)
-    measures = json.load(file)
+    measures = json.loads(Path(measure_path).read_text())
     return measures
 
 
@@ -150,7 +175,7 @@ def gps_analysis(filepath, timezone):
 
         # quality check
         gutil.gps_quality(data)
-        mean_acc = np.mean(data.accuracy)
+        mean_acc = data.accuracy.to_numpy().mean()
 
         # change format for forest imputation by creating empty columns
         data["UTC time"] = pd.NA
@@ -160,7 +185,7 @@ def gps_analysis(filepath, timezone):
 
         mobmat1 = gps_to_mobmat(data, 10, 51, 10, mean_acc, 10)
         mobmat2 = infer_mobmat(mobmat1, 10, 10)
-        out_dict = bv_select(
+        bv_set = bv_select(
             mobmat2, 0.01, 0.05, 100,
             [
                 60 * 60 * 24 * 10, 60 * 60 * 24 * 30,
@@ -168,10 +193,10 @@ def gps_analysis(filepath, timezone):
             ],
             None,
             None,
-        )
+        )["BV_set"]
         imp_table = impute_gps(
             mobmat2,
-            out_dict["BV_set"],
+            bv_set,
             "GLC", 3, 10, 2,
             timezone,
             [
@@ -183,15 +208,13 @@ def gps_analysis(filepath, timezone):
         # raise error if traj coordinates are not in the range of
         # [-90, 90] and [-180, 180]
         if traj.shape[0] > 0:
+            lat = traj[:, [1, 4]]
+            lon = traj[:, [2, 5]]
             if (
-                np.max(traj[:, 1]) > 90
-                or np.min(traj[:, 1]) < -90
-                or np.max(traj[:, 2]) > 180
-                or np.min(traj[:, 2]) < -180
-                or np.max(traj[:, 4]) > 90
-                or np.min(traj[:, 4]) < -90
-                or np.max(traj[:, 5]) > 180
-                or np.min(traj[:, 5]) < -180
+                lat.min() < -90
+                or lat.max() > 90
+                or lon.min() < -180
+                or lon.max() > 180
             ):
                 raise ValueError(
                     "Trajectory coordinates are not in the range of "
@@ -207,10 +230,10 @@ def gps_analysis(filepath, timezone):
         hourly, daily, summary = df_list
 
         if hourly.shape[0] == 0:
-            hourly.loc[0] = pd.NA
+            hourly = _empty_stub(hourly.columns)
         if daily.shape[0] == 0:
-            daily.loc[0] = pd.NA
+            daily = _empty_stub(daily.columns)
         if summary.shape[0] == 0:
-            summary.loc[0] = pd.NA
+            summary = _empty_stub(summary.columns)
 
     return hourly, daily, summary
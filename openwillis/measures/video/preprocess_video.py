@@ -11,6 +11,8 @@ from deepface import DeepFace
 from dataclasses import dataclass, field
 from sklearn.cluster import KMeans
 
+from openwillis.measures.video.util import crop_utils as cutil
+
 logging.basicConfig(level=logging.INFO)
 logger=logging.getLogger()
 
@@ -77,7 +79,7 @@ class FaceData:
             self.bb_y + self.bb_h > image.shape[0]):
             Warning("Bounding box exceeds the limits of the provided image. Setting bounding box to full frame and confidence to 0")
 
-        cropped_image = image[self.bb_y:self.bb_y + self.bb_h, self.bb_x:self.bb_x + self.bb_w]
+        cropped_image = cutil.crop_roi(image, self.bb_x, self.bb_y, self.bb_w, self.bb_h)
         self.face = cropped_image
 
 def get_config(filepath, json_file):
@@ -0,0 +1,195 @@
+import numpy as np
+import torch
+import torch.nn.functional as F
+
+from openwillis.measures.video.util import crop_utils as cutil
+
+def get_crop_params(detections, frame_w, frame_h, default_size, padding_percent=0.1):
+    """
+    Compute the per-frame placement of the padded face crop inside the output frame, matching
+    crop_with_padding_and_center.
+
+    Parameters:
+    ----------
+    detections : list
+        List of dictionaries containing bounding box information, one per frame in the batch.
+    frame_w, frame_h : int
+        Size of the decoded frames.
+    default_size : tuple
+        Size (width, height) of the output frames.
+    padding_percent : float, optional
+        The percentage of padding to add around the bounding box (default is 10%).
+
+    Returns:
+    -------
+    numpy.ndarray
+        A (B, 8) int array of (x0, y0, crop_w, crop_h, x_offset, y_offset, new_w, new_h) per frame.
+        Frames without a face or with an empty crop have new_w = new_h = 0.
+    """
+    out_w, out_h = default_size
+    params = np.zeros((len(detections), 8), dtype=np.int64)
+
+    for index, frame_dict in enumerate(detections):
+        if not frame_dict:
+            continue
+
+        x, y, w, h = cutil.pad_bbox(frame_dict['bb_x'], frame_dict['bb_y'], frame_dict['bb_w'], frame_dict['bb_h'], padding_percent)
+        x0, y0, x1, y1 = cutil.clip_bounding_box(x, y, w, h, frame_w, frame_h)
+        crop_w, crop_h = x1 - x0, y1 - y0
+
+        if crop_w == 0 or crop_h == 0:
+            continue
+
+        new_w, new_h = crop_w, crop_h
+        if crop_w > out_w or crop_h > out_h:
+            new_w, new_h = cutil.get_fit_size(crop_w, crop_h, out_w, out_h)
+
+        params[index] = [x0, y0, crop_w, crop_h, (out_w - new_w) // 2, (out_h - new_h) // 2, new_w, new_h]
+
+    return params
+
+def batched_crop_available():
+    """
+    Check whether batched cropping can run, it is only used on CUDA devices since the numpy path is
+    faster on the CPU.
+
+    Returns:
+    -------
+    bool
+        True if a CUDA device is available to torch.
+    """
+    return torch.cuda.is_available()
+
+def stack_crops(frames, params):
+    """
+    Copy the padded, clipped face crop of each frame into the top-left corner of a shared zero-padded
+    array, so only the crop regions are transferred and converted instead of the full frames.
+
+    Parameters:
+    ----------
+    frames : list
+        Decoded (H, W, 3) uint8 frames.
+    params : numpy.ndarray
+        A (B, 8) int array of crop placements from get_crop_params.
+
+    Returns:
+    -------
+    numpy.ndarray
+        A (B, max_crop_h, max_crop_w, 3) uint8 array of crops.
+    """
+    crops = np.zeros((len(frames), max(params[:, 3].max(), 1), max(params[:, 2].max(), 1), 3), dtype=np.uint8)
+
+    for index, (frame, (x0, y0, crop_w, crop_h)) in enumerate(zip(frames, params[:, :4])):
+        crops[index, :crop_h, :crop_w] = cutil.crop_roi(frame, x0, y0, crop_w, crop_h)
+
+    return crops
+
+def crop_batch(crops, params, default_size):
+    """
+    Resize and center a batch of face crops in a single grid_sample call. Bilinear sampling matches the
+    INTER_LINEAR resize of resize_to_fit, so crops must not be downscaled by more than 4x.
+
+    Parameters:
+    ----------
+    crops : torch.Tensor
+        A (B, max_crop_h, max_crop_w, 3) uint8 tensor of crops from stack_crops.
+    params : torch.Tensor
+        A (B, 8) tensor of crop placements from get_crop_params.
+    default_size : tuple
+        Size (width, height) of the output frames.
+
+    Returns:
+    -------
+    torch.Tensor
+        A (B, out_h, out_w, 3) uint8 tensor of face frames.
+    """
+    batch, crops_h, crops_w = crops.shape[:3]
+    out_w, out_h = default_size
+    device = crops.device
+
+    params = params.to(device=device, dtype=torch.float32)
+    crop_w, crop_h, x_offset, y_offset, new_w, new_h = params[:, 2:].unbind(dim=1)
+
+    # output pixel centers mapped back to crop pixel coordinates
+    cols = torch.arange(out_w, device=device, dtype=torch.float32)[None, :]
+    rows = torch.arange(out_h, device=device, dtype=torch.float32)[None, :]
+
+    scale_x = (crop_w / new_w.clamp(min=1))[:, None]
+    scale_y = (crop_h / new_h.clamp(min=1))[:, None]
+    src_x = (cols - x_offset[:, None] + 0.5) * scale_x - 0.5
+    src_y = (rows - y_offset[:, None] + 0.5) * scale_y - 0.5
+
+    # normalize to [-1, 1] for grid_sample with align_corners=False
+    grid_x = (2 * src_x + 1) / crops_w - 1
+    grid_y = (2 * src_y + 1) / crops_h - 1
+    grid = torch.stack([grid_x[:, None, :].expand(batch, out_h, out_w), grid_y[:, :, None].expand(batch, out_h, out_w)], dim=-1)
+
+    mask_x = (cols >= x_offset[:, None]) & (cols < (x_offset + new_w)[:, None])
+    mask_y = (rows >= y_offset[:, None]) & (rows < (y_offset + new_h)[:, None])
+    mask = (mask_y[:, :, None] & mask_x[:, None, :])[:, None]
+
+    images = crops.permute(0, 3, 1, 2).float()
+    face_frames = F.grid_sample(images, grid, mode='bilinear', padding_mode='zeros', align_corners=False)
+    face_frames = face_frames * mask
+
+    return face_frames.round().clamp(0, 255).to(torch.uint8).permute(0, 2, 3, 1).contiguous()
+
+def write_face_frames_batched(cap, writer, detections, default_size, trim, batch_size=16):
+    """
+    Decode frames on the CPU and create cropped face frames in batches with torch, writing them to the
+    video writer in their original order. Only the face crop regions are transferred to the device;
+    crops downscaled by more than 4x use the numpy INTER_AREA path instead.
+
+    Parameters:
+    ----------
+    cap : cv2.VideoCapture
+        Opened video capture.
+    writer : cv2.VideoWriter
+        Opened video writer.
+    detections : list
+        List of dictionaries containing bounding box information, one per frame.
+    default_size : tuple
+        Size (width, height) of the output frames.
+    trim : bool
+        Flag to only write frames with bounding box information.
+    batch_size : int, optional
+        Number of frames processed per batch, by default 16.
+    """
+    decoder, frame_queue, stop_event = cutil.start_decoder(cap, len(detections), 2 * batch_size)
+
+    try:
+        frame_items = iter(frame_queue.get, None)
+
+        while True:
+            batch_items = [item for _, item in zip(range(batch_size), frame_items)]
+            if not batch_items:
+                break
+
+            batch_detections = [detections[frame_index] for frame_index, _ in batch_items]
+            frames = [frame for _, frame in batch_items]
+            face_frames = [None] * len(frames)
+
+            params = get_crop_params(batch_detections, frames[0].shape[1], frames[0].shape[0], default_size)
+
+            # grid_sample matches INTER_LINEAR only up to 4x downscales, larger ones need INTER_AREA;
+            # those and frames without a usable face crop are handled by the numpy path
+            area_downscale = (params[:, 2] > 4 * params[:, 6]) | (params[:, 3] > 4 * params[:, 7])
+            on_gpu = (params[:, 6] > 0) & ~area_downscale
+
+            gpu_index = np.flatnonzero(on_gpu)
+            for index in np.flatnonzero(~on_gpu):
+                face_frames[index] = cutil.create_face_frame(batch_detections[index], frames[index], default_size=default_size, trim=trim)
+
+            if len(gpu_index) > 0:
+                gpu_params = params[gpu_index]
+                crops = stack_crops([frames[index] for index in gpu_index], gpu_params)
+                cropped = crop_batch(torch.from_numpy(crops).to('cuda'), torch.from_numpy(gpu_params), default_size).cpu().numpy()
+
+                for index, face_frame in zip(gpu_index, cropped):
+                    face_frames[index] = face_frame
+
+            for face_frame in face_frames:
+                cutil.write_face_frame(writer, face_frame)
+
+    finally:
+        cutil.stop_decoder(decoder, frame_queue, stop_event)
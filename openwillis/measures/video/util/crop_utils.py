@@ -1,10 +1,39 @@
 import cv2
 import numpy as np
 import logging
+import functools
+import os
+import queue
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 
 logging.basicConfig(level=logging.INFO)
 logger=logging.getLogger()
 
+def crop_roi(img, x, y, w, h):
+    """
+    ---------------------------------------------------------------------------------------------------
+
+    Crop an image to a bounding box given as raw integer coordinates.
+    The returned region is a view into the image, no pixels are copied.
+
+    Parameters:
+    ----------
+    img : numpy.ndarray
+        The image to be cropped.
+    x, y, w, h : int
+        The top-left corner, width and height of the bounding box.
+
+    Returns:
+    -------
+    numpy.ndarray
+        The cropped region of the image.
+
+    ---------------------------------------------------------------------------------------------------
+    """
+    return img[y:y+h, x:x+w]
+
 def crop_img(img, bb_dict):
     """
     ---------------------------------------------------------------------------------------------------
@@ -32,11 +61,7 @@ def crop_img(img, bb_dict):
     ---------------------------------------------------------------------------------------------------
     """
 
-    x = bb_dict['bb_x']
-    y = bb_dict['bb_y']
-    w = bb_dict['bb_w']
-    h = bb_dict['bb_h']
-    roi = img[y:y+h, x:x+w]
+    roi = crop_roi(img, bb_dict['bb_x'], bb_dict['bb_y'], bb_dict['bb_w'], bb_dict['bb_h'])
     return roi
 
 def draw_bounding_boxes_sf(frame, bb_dict):
@@ -56,13 +81,40 @@ def draw_bounding_boxes_sf(frame, bb_dict):
     ---------------------------------------------------------------------------------------------------
     
     """
-    x = bb_dict['bb_x']
-    y = bb_dict['bb_y']
-    w = bb_dict['bb_w']
-    h = bb_dict['bb_h']
-    cv2.rectangle(frame, (x, y), (x+w, y+h), (0, 255, 0), 2)
+    frame_h, frame_w = frame.shape[:2]
+    x0, y0, x1, y1 = clip_bounding_box(bb_dict['bb_x'], bb_dict['bb_y'], bb_dict['bb_w'], bb_dict['bb_h'], frame_w, frame_h)
+
+    if x1 == x0 or y1 == y0:
+        return frame
+
+    # axis-aligned 2 pixel border written directly with slice assignments, kept inside the clipped box
+    frame[y0:min(y0+2, y1), x0:x1] = (0, 255, 0)
+    frame[max(y0, y1-2):y1, x0:x1] = (0, 255, 0)
+    frame[y0:y1, x0:min(x0+2, x1)] = (0, 255, 0)
+    frame[y0:y1, max(x0, x1-2):x1] = (0, 255, 0)
     return frame
 
+def pad_bbox(x, y, w, h, padding_percent):
+    """
+    Calculate the padded bounding box from raw integer coordinates.
+
+    Parameters:
+    ----------
+    x, y, w, h : int
+        The top-left corner, width and height of the bounding box.
+    padding_percent : float
+        The percentage of padding to add around the bounding box.
+
+    Returns:
+    -------
+    tuple
+        The padded (x, y, w, h) bounding box, with the top-left corner clipped at 0.
+    """
+    padding_x = int(w * padding_percent)
+    padding_y = int(h * padding_percent)
+
+    return max(0, x - padding_x), max(0, y - padding_y), w + 2 * padding_x, h + 2 * padding_y
+
 def calculate_padding(bb_dict, padding_percent):
     """
     Calculate the padding around the bounding box based on a percentage.
@@ -84,21 +136,46 @@ def calculate_padding(bb_dict, padding_percent):
     dict
         A dictionary containing the new bounding box coordinates with padding.
     """
-    x = bb_dict['bb_x']
-    y = bb_dict['bb_y']
-    w = bb_dict['bb_w']
-    h = bb_dict['bb_h']
-    
-    padding_x = int(w * padding_percent)
-    padding_y = int(h * padding_percent)
-    
+    x, y, w, h = pad_bbox(bb_dict['bb_x'], bb_dict['bb_y'], bb_dict['bb_w'], bb_dict['bb_h'], padding_percent)
+
     return {
-        'bb_x': max(0, x - padding_x),
-        'bb_y': max(0, y - padding_y),
-        'bb_w': w + 2 * padding_x,
-        'bb_h': h + 2 * padding_y
+        'bb_x': x,
+        'bb_y': y,
+        'bb_w': w,
+        'bb_h': h
     }
 
+@functools.lru_cache(maxsize=1024)
+def get_fit_size(w, h, frame_w, frame_h):
+    """
+    Compute the size that fits a (w, h) image within the frame while maintaining the aspect ratio.
+    Bounding boxes change slowly between frames, so results are cached.
+
+    Parameters:
+    ----------
+    w, h : int
+        The size of the image.
+    frame_w, frame_h : int
+        The size of the frame.
+
+    Returns:
+    -------
+    tuple
+        The (new_w, new_h) size of the resized image.
+    """
+    # compare aspect ratios by integer cross-multiplication instead of float division
+    if w * frame_h > h * frame_w:
+        # Width is the limiting factor
+        new_w = frame_w
+        new_h = (frame_w * h) // w
+    else:
+        # Height is the limiting factor
+        new_h = frame_h
+        new_w = (frame_h * w) // h
+
+    # very thin crops can floor a side to 0, which cv2.resize cannot handle
+    return max(new_w, 1), max(new_h, 1)
+
 def resize_to_fit(img, frame_size):
     """
     Resize the image to fit within the frame size while maintaining the aspect ratio.
@@ -116,24 +193,18 @@ def resize_to_fit(img, frame_size):
         The resized image that fits within the specified frame size.
     """
     h, w = img.shape[:2]
-    frame_w, frame_h = frame_size
-    
-    aspect_ratio = w / h
-    frame_aspect_ratio = frame_w / frame_h
-    
-    if aspect_ratio > frame_aspect_ratio:
-        # Width is the limiting factor
-        new_w = frame_w
-        new_h = int(new_w / aspect_ratio)
+    new_w, new_h = get_fit_size(w, h, *frame_size)
+
+    # INTER_LINEAR is visually equivalent for moderate downscales; keep INTER_AREA for large ones
+    if max(w / new_w, h / new_h) > 4:
+        interpolation = cv2.INTER_AREA
     else:
-        # Height is the limiting factor
-        new_h = frame_h
-        new_w = int(new_h * aspect_ratio)
-    
-    resized_img = cv2.resize(img, (new_w, new_h), interpolation=cv2.INTER_AREA)
+        interpolation = cv2.INTER_LINEAR
+
+    resized_img = cv2.resize(img, (new_w, new_h), interpolation=interpolation)
     return resized_img
 
-def center_in_frame(cropped_img, frame_size=(512, 512), background_color=(0, 0, 0)):
+def center_in_frame(cropped_img, frame_size=(512, 512), background_color=(0, 0, 0), out=None):
     """
     Center the cropped and padded image in a specified frame.
 
@@ -145,6 +216,9 @@ def center_in_frame(cropped_img, frame_size=(512, 512), background_color=(0, 0,
         The size of the frame (default is 512x512 pixels).
     background_color : tuple, optional
         The background color of the frame (default is black, (0, 0, 0)).
+    out : numpy.ndarray, optional
+        Reusable (height, width, 3) uint8 canvas. Only the area around the centered image is reset to the
+        background color. If None, a new frame is allocated.
 
     Returns:
     -------
@@ -157,10 +231,18 @@ def center_in_frame(cropped_img, frame_size=(512, 512), background_color=(0, 0,
         cropped_img = resize_to_fit(cropped_img, frame_size)
         h_padded, w_padded = cropped_img.shape[:2]
     
-    frame = np.full((frame_size[1], frame_size[0], 3), background_color, dtype=np.uint8)
-    
     x_offset = (frame_size[0] - w_padded) // 2
     y_offset = (frame_size[1] - h_padded) // 2
+
+    if out is None:
+        frame = np.full((frame_size[1], frame_size[0], 3), background_color, dtype=np.uint8)
+    else:
+        # the centered image overwrites its own region, so only reset the borders around it
+        frame = out
+        frame[:y_offset] = background_color
+        frame[y_offset + h_padded:] = background_color
+        frame[y_offset:y_offset + h_padded, :x_offset] = background_color
+        frame[y_offset:y_offset + h_padded, x_offset + w_padded:] = background_color
     
     frame[y_offset:y_offset + h_padded, x_offset:x_offset + w_padded] = cropped_img
     
@@ -171,7 +253,8 @@ def crop_with_padding_and_center(
     bb_dict, 
     padding_percent=0.1, 
     frame_size=(512, 512),
-    background_color=(0, 0, 0)
+    background_color=(0, 0, 0),
+    out=None
 ):
     """
     Crop an image with padding around the bounding box and center it in a frame.
@@ -188,19 +271,22 @@ def crop_with_padding_and_center(
         The size of the frame (default is 512x512 pixels).
     background_color : tuple, optional
         The background color of the frame (default is black, (0, 0, 0)).
+    out : numpy.ndarray, optional
+        Reusable canvas for the centered image (default is None, a new frame is allocated).
 
     Returns:
     -------
     numpy.ndarray
         The padded and centered image within the specified frame.
     """
-    padded_bb_dict = calculate_padding(bb_dict, padding_percent)
-    padded_crop = crop_img(img, padded_bb_dict)
-    final_img = center_in_frame(padded_crop, frame_size, background_color)
+    # unpack the bounding box once and slice with plain ints, avoiding the intermediate padded dict
+    x, y, w, h = pad_bbox(bb_dict['bb_x'], bb_dict['bb_y'], bb_dict['bb_w'], bb_dict['bb_h'], padding_percent)
+    padded_crop = crop_roi(img, x, y, w, h)
+    final_img = center_in_frame(padded_crop, frame_size, background_color, out=out)
     
     return final_img
 
-def blacken_outside_bounding_box(frame, bb_dict):
+def blacken_outside_bounding_box(frame, bb_dict, out=None):
     """
     ---------------------------------------------------------------------------------------------------
 
@@ -216,6 +302,9 @@ def blacken_outside_bounding_box(frame, bb_dict):
         'bb_y' (int): The y-coordinate of the top-left corner of the bounding box.
         'bb_w' (int): The width of the bounding box.
         'bb_h' (int): The height of the bounding box.
+    out : numpy.ndarray, optional
+        Preallocated destination with the same shape as frame; may be frame itself to blacken in place.
+        If None, a copy of the frame is allocated.
 
     Returns:
     ............
@@ -224,16 +313,22 @@ def blacken_outside_bounding_box(frame, bb_dict):
     ---------------------------------------------------------------------------------------------------
 
     """
-    x = bb_dict['bb_x']
-    y = bb_dict['bb_y']
-    w = bb_dict['bb_w']
-    h = bb_dict['bb_h']
+    # clip to the frame so negative coordinates do not wrap around, matching the GPU path
+    frame_h, frame_w = frame.shape[:2]
+    x0, y0, x1, y1 = clip_bounding_box(bb_dict['bb_x'], bb_dict['bb_y'], bb_dict['bb_w'], bb_dict['bb_h'], frame_w, frame_h)
 
-    # Create a black image of the same size as the frame
-    mask = np.zeros_like(frame)
+    # Copy the frame and zero the four border regions around the bounding box
+    if out is None:
+        mask = frame.copy()
+    else:
+        mask = out
+        if mask is not frame:
+            np.copyto(mask, frame)
 
-    # Copy the bounding box area from the original frame to the mask
-    mask[y:y+h, x:x+w] = frame[y:y+h, x:x+w]
+    mask[:y0].fill(0)
+    mask[y1:].fill(0)
+    mask[y0:y1, :x0].fill(0)
+    mask[y0:y1, x1:].fill(0)
 
     return mask
 
@@ -242,6 +337,7 @@ def create_cropped_frame(
     frame_dict,
     crop=True,
     default_size=(512,512),
+    out=None
     ):
     """
     Blackens the area outside a specified bounding box in the given frame or crops the frame with padding and centering.
@@ -260,6 +356,9 @@ def create_cropped_frame(
         If False, blackens the area outside the bounding box. If True, crops the frame with padding and centering. Default is True.
     default_size : tuple, optional
         The size of the cropped frame if `crop` is True. Default is (512, 512).
+    out : numpy.ndarray, optional
+        Preallocated destination for the face frame: a frame-sized buffer (possibly the frame itself) when `crop` is False,
+        or a reusable `default_size` canvas when `crop` is True. Default is None.
 
     Returns:
     -------
@@ -273,20 +372,43 @@ def create_cropped_frame(
     """
     
     if crop:
-        face_frame = crop_with_padding_and_center(frame, frame_dict, frame_size=default_size)
+        face_frame = crop_with_padding_and_center(frame, frame_dict, frame_size=default_size, out=out)
     else:
-        face_frame = blacken_outside_bounding_box(frame, frame_dict)
+        face_frame = blacken_outside_bounding_box(frame, frame_dict, out=out)
         
     return face_frame
 
 
+@functools.lru_cache(maxsize=4)
+def get_blank_frame(shape):
+    """
+    Get a shared black frame of the given shape, used for frames without a detected face.
+    The frame is read-only since the same array is returned on every call.
+
+    Parameters:
+    ----------
+    shape : tuple
+        The (height, width, channels) shape of the frame.
+
+    Returns:
+    -------
+    numpy.ndarray
+        A read-only black uint8 frame.
+    """
+    blank_frame = np.zeros(shape, dtype=np.uint8)
+    blank_frame.flags.writeable = False
+
+    return blank_frame
+
+
 def create_face_frame(
         frame_dict,
         frame,
         default_size=(512,512),
         trim=True,
         debug=False,
-        crop=True
+        crop=True,
+        out=None
         ):
     """
     Create a face frame by cropping the input frame based on the provided frame dictionary and booleans for
@@ -299,18 +421,21 @@ def create_face_frame(
         default_size (tuple, optional): The default size of the cropped face frame. Defaults to (512, 512).
         trim (bool, optional): Whether to the trim video so only frames with face present are retained. Defaults to True.
         crop (bool, optional): Whether to crop the cropped face frame. Defaults to True.
+        out (numpy.ndarray, optional): Preallocated destination for the face frame, frame-sized when crop is False or a
+            default_size canvas when crop is True. Defaults to None.
 
     Returns:
-        numpy.ndarray: The cropped face frame.
+        numpy.ndarray: The cropped face frame. Frames without a face share a read-only black frame.
     """
     
-    if len(frame_dict.keys()) != 0:
+    if frame_dict:
 
         face_frame = create_cropped_frame(
             frame,
             frame_dict,
             crop=crop,
             default_size=default_size,
+            out=out
         )
 
     elif debug:
@@ -320,9 +445,9 @@ def create_face_frame(
     elif not trim:
         
         if crop:
-            face_frame = np.zeros(default_size+(3,),dtype=np.uint8)     
+            face_frame = get_blank_frame(default_size+(3,))
         else:
-            face_frame = np.zeros_like(frame,dtype=np.uint8)
+            face_frame = get_blank_frame(frame.shape)
             
     else:
 
@@ -330,6 +455,354 @@ def create_face_frame(
     
     return face_frame
 
+def read_frames(cap, frame_queue, max_frames, stop_event):
+    """
+    Decode frames from the video capture and push (frame_index, frame) tuples onto a queue.
+    A None sentinel is pushed once decoding stops.
+
+    Parameters:
+    ----------
+    cap : cv2.VideoCapture
+        Opened video capture.
+    frame_queue : queue.Queue
+        Bounded queue receiving the decoded frames.
+    max_frames : int
+        Maximum number of frames to decode.
+    stop_event : threading.Event
+        Event signalling the consumer has stopped early.
+    """
+    frame_index = 0
+
+    while frame_index < max_frames and not stop_event.is_set():
+        ret, frame = cap.read()
+        if not ret:
+            break
+
+        frame_queue.put((frame_index, frame))
+        frame_index += 1
+
+    frame_queue.put(None)
+
+def start_decoder(cap, max_frames, maxsize):
+    """
+    Start a background thread decoding frames from the video capture into a bounded queue.
+
+    Parameters:
+    ----------
+    cap : cv2.VideoCapture
+        Opened video capture.
+    max_frames : int
+        Maximum number of frames to decode.
+    maxsize : int
+        Maximum number of decoded frames waiting in the queue.
+
+    Returns:
+    -------
+    decoder : threading.Thread
+        The running decoder thread.
+    frame_queue : queue.Queue
+        Queue receiving (frame_index, frame) tuples, terminated by None.
+    stop_event : threading.Event
+        Event used by stop_decoder to stop decoding early.
+    """
+    frame_queue = queue.Queue(maxsize=maxsize)
+    stop_event = threading.Event()
+
+    decoder = threading.Thread(target=read_frames, args=(cap, frame_queue, max_frames, stop_event), daemon=True)
+    decoder.start()
+
+    return decoder, frame_queue, stop_event
+
+def stop_decoder(decoder, frame_queue, stop_event):
+    """
+    Stop the decoder thread started by start_decoder and wait for it to exit.
+
+    Parameters:
+    ----------
+    decoder : threading.Thread
+        The decoder thread.
+    frame_queue : queue.Queue
+        The queue the decoder pushes frames onto.
+    stop_event : threading.Event
+        The decoder stop event.
+    """
+    stop_event.set()
+
+    # free a queue slot in case the decoder is blocked on a full queue
+    while decoder.is_alive():
+        try:
+            frame_queue.get(timeout=0.1)
+        except queue.Empty:
+            pass
+
+def write_face_frames(cap, writer, detections, default_size, trim, debug, crop, max_workers=None):
+    """
+    Decode frames on the CPU, create the face frame for each one and write it to the video writer.
+    Decoding runs in a background thread and face frames are created by a pool of workers
+    (cv2 and numpy release the GIL), while frames are written in their original order.
+
+    Parameters:
+    ----------
+    cap : cv2.VideoCapture
+        Opened video capture.
+    writer : cv2.VideoWriter
+        Opened video writer.
+    detections : list
+        List of dictionaries containing bounding box information, one per frame.
+    default_size : tuple
+        Default size for the cropped frames.
+    trim : bool
+        Flag to only write frames with bounding box information.
+    debug : bool
+        Flag to keep the original frames when no face is detected.
+    crop : bool
+        Flag to crop frames to the bounding box instead of blackening outside it.
+    max_workers : int, optional
+        Number of worker threads creating face frames, by default half the available cores.
+    """
+    if max_workers is None:
+        max_workers = max(1, (os.cpu_count() or 2) // 2)
+
+    decoder, frame_queue, stop_event = start_decoder(cap, len(detections), 32)
+
+    pending = deque()
+
+    # one reusable crop canvas per frame in flight, returned to the pool once the frame is written
+    canvases = deque()
+    if crop:
+        canvases.extend(np.zeros((default_size[1], default_size[0], 3), dtype=np.uint8) for _ in range(2 * max_workers + 1))
+
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for frame_index, frame in iter(frame_queue.get, None):
+
+                # the decoded frame is not reused, so blacken it in place instead of allocating a copy
+                out = canvases.popleft() if crop else frame
+                future = executor.submit(
+                    create_face_frame,
+                    detections[frame_index],
+                    frame,
+                    default_size=default_size,
+                    trim=trim,
+                    debug=debug,
+                    crop=crop,
+                    out=out
+                )
+                pending.append((future, out))
+
+                # write finished frames in order and bound the number of frames in flight
+                while pending and (pending[0][0].done() or len(pending) > 2 * max_workers):
+                    future, out = pending.popleft()
+                    write_face_frame(writer, future.result())
+
+                    if crop:
+                        canvases.append(out)
+
+            for future, _ in pending:
+                write_face_frame(writer, future.result())
+
+    finally:
+        stop_decoder(decoder, frame_queue, stop_event)
+
+def write_face_frame(writer, face_frame):
+    """
+    Write the face frame to the video writer if it is not empty.
+
+    Parameters:
+    ----------
+    writer : cv2.VideoWriter
+        Opened video writer.
+    face_frame : numpy.ndarray
+        The face frame; empty when no face was detected and the video is trimmed.
+    """
+    # Check if face_frame is not empty (i.e., face detected)
+    if face_frame.size != 0:
+        writer.write(face_frame)
+
+def cuda_video_available():
+    """
+    Check whether OpenCV was built with CUDA video decoding and a CUDA device is present.
+
+    Returns:
+    -------
+    bool
+        True if frames can be decoded with cv2.cudacodec.
+    """
+    if not hasattr(cv2, 'cudacodec'):
+        return False
+
+    return cv2.cuda.getCudaEnabledDeviceCount() > 0
+
+def clip_bounding_box(x, y, w, h, frame_w, frame_h):
+    """
+    Clip bounding box coordinates to the frame, matching numpy slicing semantics.
+
+    Parameters:
+    ----------
+    x, y, w, h : int
+        The top-left corner, width and height of the bounding box.
+    frame_w : int
+        Width of the frame.
+    frame_h : int
+        Height of the frame.
+
+    Returns:
+    -------
+    tuple
+        The clipped (x0, y0, x1, y1) corners of the bounding box.
+    """
+    x0 = min(max(x, 0), frame_w)
+    y0 = min(max(y, 0), frame_h)
+    x1 = max(min(x + w, frame_w), x0)
+    y1 = max(min(y + h, frame_h), y0)
+
+    return x0, y0, x1, y1
+
+def blacken_outside_bounding_box_gpu(gpu_frame, bb_dict):
+    """
+    Blackens the area outside a specified bounding box of a GPU frame in place.
+
+    Parameters:
+    ----------
+    gpu_frame : cv2.cuda_GpuMat
+        The decoded frame on the GPU.
+    bb_dict : dict
+        A dictionary containing the bounding box coordinates.
+
+    Returns:
+    -------
+    cv2.cuda_GpuMat
+        The GPU frame with the area outside the bounding box blackened.
+    """
+    frame_w, frame_h = gpu_frame.size()
+    x0, y0, x1, y1 = clip_bounding_box(bb_dict['bb_x'], bb_dict['bb_y'], bb_dict['bb_w'], bb_dict['bb_h'], frame_w, frame_h)
+
+    borders = [(0, y0, 0, frame_w), (y1, frame_h, 0, frame_w), (y0, y1, 0, x0), (y0, y1, x1, frame_w)]
+    for row_start, row_end, col_start, col_end in borders:
+
+        if row_end > row_start and col_end > col_start:
+            gpu_frame.rowRange(row_start, row_end).colRange(col_start, col_end).setTo((0, 0, 0, 0))
+
+    return gpu_frame
+
+def create_face_frame_gpu(frame_dict, gpu_frame, default_size=(512,512), trim=True, debug=False, crop=True, out=None):
+    """
+    GPU counterpart of create_face_frame. The crop or blackening is done on the GPU and only the
+    resulting region is downloaded to host memory.
+
+    Parameters:
+    ----------
+        frame_dict (dict): A dictionary containing the coordinates of the face region in the frame.
+        gpu_frame (cv2.cuda_GpuMat): The decoded BGR frame on the GPU.
+        default_size (tuple, optional): The default size of the cropped face frame. Defaults to (512, 512).
+        trim (bool, optional): Whether to the trim video so only frames with face present are retained. Defaults to True.
+        debug (bool, optional): Whether to keep the original frame when no face is detected. Defaults to False.
+        crop (bool, optional): Whether to crop the cropped face frame. Defaults to True.
+        out (numpy.ndarray, optional): Reusable default_size canvas for the cropped face frame. Defaults to None.
+
+    Returns:
+        numpy.ndarray: The cropped face frame.
+    """
+    frame_w, frame_h = gpu_frame.size()
+
+    if frame_dict:
+
+        if crop:
+            x, y, w, h = pad_bbox(frame_dict['bb_x'], frame_dict['bb_y'], frame_dict['bb_w'], frame_dict['bb_h'], 0.1)
+            x0, y0, x1, y1 = clip_bounding_box(x, y, w, h, frame_w, frame_h)
+
+            if x1 > x0 and y1 > y0:
+                padded_crop = gpu_frame.rowRange(y0, y1).colRange(x0, x1).download()
+            else:
+                padded_crop = np.zeros((y1 - y0, x1 - x0, 3), dtype=np.uint8)
+
+            face_frame = center_in_frame(padded_crop, default_size, out=out)
+        else:
+            face_frame = blacken_outside_bounding_box_gpu(gpu_frame, frame_dict).download()
+
+    elif debug:
+
+        face_frame = gpu_frame.download()
+
+    elif not trim:
+
+        if crop:
+            face_frame = get_blank_frame(default_size+(3,))
+        else:
+            face_frame = get_blank_frame((frame_h, frame_w, 3))
+
+    else:
+
+        face_frame = np.array([])
+
+    return face_frame
+
+def create_gpu_reader(video_path):
+    """
+    Open the video with cv2.cudacodec (NVDEC).
+
+    Parameters:
+    ----------
+    video_path : str
+        Path to the video file.
+
+    Returns:
+    -------
+    cv2.cudacodec.VideoReader or None
+        The GPU video reader, or None if NVDEC cannot open the video (e.g. unsupported codec or container).
+    """
+    try:
+        return cv2.cudacodec.createVideoReader(video_path)
+
+    except cv2.error as e:
+        logger.warning(f"Unable to decode video on the GPU, falling back to CPU decoding: {e}")
+        return None
+
+def write_face_frames_gpu(reader, writer, detections, default_size, trim, debug, crop):
+    """
+    Decode frames with cv2.cudacodec (NVDEC), create the face frame for each one on the GPU and
+    write it to the video writer.
+
+    Parameters:
+    ----------
+    reader : cv2.cudacodec.VideoReader
+        GPU video reader from create_gpu_reader.
+    writer : cv2.VideoWriter
+        Opened video writer.
+    detections : list
+        List of dictionaries containing bounding box information, one per frame.
+    default_size : tuple
+        Default size for the cropped frames.
+    trim : bool
+        Flag to only write frames with bounding box information.
+    debug : bool
+        Flag to keep the original frames when no face is detected.
+    crop : bool
+        Flag to crop frames to the bounding box instead of blackening outside it.
+    """
+    # frames are written before the next one is cropped, so a single canvas is reused
+    canvas = np.zeros((default_size[1], default_size[0], 3), dtype=np.uint8)
+
+    for frame_dict in detections:
+        ret, gpu_frame = reader.nextFrame()
+        if not ret:
+            break
+
+        # cudacodec decodes to BGRA
+        gpu_frame = cv2.cuda.cvtColor(gpu_frame, cv2.COLOR_BGRA2BGR)
+
+        face_frame = create_face_frame_gpu(
+            frame_dict,
+            gpu_frame,
+            default_size=default_size,
+            trim=trim,
+            debug=debug,
+            crop=crop,
+            out=canvas
+        )
+
+        write_face_frame(writer, face_frame)
+
 def create_cropped_video(
     video_path,
     detections,
@@ -337,7 +810,9 @@ def create_cropped_video(
     crop=False,
     trim=True,
     debug=False,
-    default_size_for_cropped=(512, 512)
+    default_size_for_cropped=(512, 512),
+    use_cuda=True,
+    batch_size=None
 ):
     """
     Process the video by drawing bounding boxes based on the provided detections
@@ -359,6 +834,11 @@ def create_cropped_video(
         Flag to keep the original frames when no face is detected, by default False.
     default_size_for_cropped : tuple, optional
         Default size for the cropped frames, by default (512, 512).
+    use_cuda : bool, optional
+        Flag to decode and crop frames on the GPU when OpenCV is built with CUDA video decoding, by default True.
+        Falls back to CPU decoding if the GPU reader cannot open the video.
+    batch_size : int, optional
+        If set and crop is True, frames are cropped in batches of this size with torch on the GPU. Ignored when CUDA is unavailable, by default None.
 
     Raises:
     ------
@@ -390,32 +870,28 @@ def create_cropped_video(
     fourcc = cv2.VideoWriter_fourcc(*'mp4v')  # or 'XVID', 'MJPG', etc.
     out = cv2.VideoWriter(output_path, fourcc, fps, (frame_width, frame_height))
 
-    frame_index = 0
-    max_frame_index = len(detections)
+    if crop and batch_size:
+        from openwillis.measures.video.util import batch_crop_utils as bcutil #import in-case of batched cropping
 
-    while True:
-        ret, frame = cap.read()
-        if not ret:
-            break
-        if frame_index >= max_frame_index:
-            break
+        if not bcutil.batched_crop_available():
+            logger.warning("CUDA is not available. batch_size will be ignored and frames cropped with numpy.")
+            batch_size = None
 
-        frame_dict = detections[frame_index]
+    # the CPU capture stays open until the GPU reader is known to work
+    reader = None
+    if not (crop and batch_size) and use_cuda and cuda_video_available():
+        reader = create_gpu_reader(video_path)
 
-        face_frame = create_face_frame(
-            frame_dict,
-            frame,
-            default_size=default_size_for_cropped,
-            trim=trim,
-            debug=debug,
-            crop=crop
-        )
+    if crop and batch_size:
+        bcutil.write_face_frames_batched(cap, out, detections, default_size_for_cropped, trim, batch_size)
+        cap.release()
 
-        # Check if face_frame is not empty (i.e., face detected)
-        if face_frame.size != 0:
-            out.write(face_frame)
+    elif reader is not None:
+        cap.release()
+        write_face_frames_gpu(reader, out, detections, default_size_for_cropped, trim, debug, crop)
 
-        frame_index += 1
+    else:
+        write_face_frames(cap, out, detections, default_size_for_cropped, trim, debug, crop)
+        cap.release()
 
-    cap.release()
-    out.release()
\ No newline at end of file
+    out.release()